@@ -9,163 +9,306 @@ Generates realistic soil moisture and canopy temperature patterns that:
 - Include diurnal temperature patterns
 """
 
+import functools
+
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Optional
+from numba import njit
+from typing import Optional, Tuple
 
-import sys
-sys.path.append('..')
 from config import FIELD, SOIL, SENSOR, get_soil_properties
 
 
-def generate_sensor_data(
-    days: int = 14,
-    soil_texture: str = "Silt Loam",
-    include_rain_events: bool = True,
-    seed: Optional[int] = 42
-) -> pd.DataFrame:
+@njit(cache=True, fastmath=True)
+def _simulate_moisture(
+    initial: float,
+    et_volumetric: np.ndarray,
+    depletion: np.ndarray,
+    rain: np.ndarray,
+    lo: float,
+    hi: float
+):
     """
-    Generate synthetic soil moisture and canopy temperature data.
+    Step soil moisture hour by hour at each depth.
     
-    The algorithm simulates:
-    1. Base moisture starting at ~70% of field capacity
-    2. Daily ET-driven depletion (faster in shallow depths)
-    3. Rain events that increase moisture (deeper depths respond slower)
-    4. Diurnal canopy temperature patterns
+    Each hour depends on the clamped value of the previous one, so the
+    recurrence stays sequential and is compiled with Numba instead.
     
     Args:
-        days: Number of days of historical data to generate
-        soil_texture: Soil texture class for FC/PWP values
-        include_rain_events: Whether to simulate rain events
-        seed: Random seed for reproducibility
+        initial: Starting volumetric water content at every depth
+        et_volumetric: Hourly volumetric ET loss
+        depletion: Depth-specific depletion factors (6", 12", 18")
+        rain: Hourly rain infiltration per depth, shape (3, n_hours)
+        lo, hi: Physically realistic moisture range
         
     Returns:
-        DataFrame with columns: timestamp, sm_6in, sm_12in, sm_18in, 
-                               canopy_temp_c, air_temp_c
+        Tuple of moisture arrays for the 6", 12" and 18" depths
     """
-    if seed is not None:
-        np.random.seed(seed)
+    n_hours = et_volumetric.shape[0]
+    sm = np.empty((3, n_hours))
+    sm[:, 0] = initial
+    
+    for d in range(3):
+        value = initial
+        rate = depletion[d]
+        for i in range(1, n_hours):
+            value = value - et_volumetric[i] * rate + rain[d, i]
+            if value < lo:
+                value = lo
+            elif value > hi:
+                value = hi
+            sm[d, i] = value
+    
+    return sm[0], sm[1], sm[2]
+
+
+def _rain_infiltration(
+    n_hours: int,
+    rain_hours: np.ndarray,
+    rain_amounts: np.ndarray
+) -> np.ndarray:
+    """
+    Build the hourly rain contribution at each depth.
+    
+    Rain infiltrates immediately at the surface and with a 12-hour tapered
+    lag at depth. Contributions are scattered once per event, so the cost
+    is O(n_hours + 12 * n_events) rather than rescanning every event each
+    hour.
+    
+    Returns:
+        Array of shape (3, n_hours) for the 6", 12" and 18" depths
+    """
+    rain = np.zeros((3, n_hours))
+    
+    # Immediate response on the event hour
+    np.add.at(rain[0], rain_hours, rain_amounts * 0.08)  # Quick response
+    np.add.at(rain[1], rain_hours, rain_amounts * 0.04)  # Delayed
+    np.add.at(rain[2], rain_hours, rain_amounts * 0.02)  # More delayed
+    
+    # Continued infiltration to deeper depths over the next 11 hours
+    hours_since = np.arange(1, 12)
+    taper = rain_amounts[:, None] * (12 - hours_since) / 12
+    tail_hours = rain_hours[:, None] + hours_since
+    in_range = tail_hours < n_hours
+    
+    np.add.at(rain[1], tail_hours[in_range], (0.003 * taper)[in_range])
+    np.add.at(rain[2], tail_hours[in_range], (0.002 * taper)[in_range])
+    
+    return rain
+
+
+def _generate_columns(
+    days: int,
+    soil_texture: str,
+    include_rain_events: bool,
+    seed: Optional[int],
+    end_time: pd.Timestamp
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the simulation behind generate_sensor_arrays.
+    
+    Returns:
+        Tuple of timestamps (int64 ns), moisture and temperature blocks
+    """
+    rng = np.random.default_rng(seed)
     
     # Get soil properties for this texture
-    soil_props = get_soil_properties(soil_texture)
-    fc = soil_props["fc"]       # Field capacity
-    pwp = soil_props["pwp"]     # Wilting point
-    taw = soil_props["taw"]     # Total available water
+    # fc = field capacity, pwp = wilting point, taw = total available water
+    fc, pwp, taw = get_soil_properties(soil_texture)
     
     # Generate hourly timestamps
-    end_time = datetime.now().replace(minute=0, second=0, microsecond=0)
-    start_time = end_time - timedelta(days=days)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='h')
-    n_hours = len(timestamps)
+    n_hours = days * 24 + 1
+    timestamps = pd.date_range(end=end_time, periods=n_hours, freq='h')
+    hours_of_day = timestamps.hour.to_numpy()
     
     # Initialize moisture at each depth (start at ~70% of available water)
     initial_moisture = pwp + 0.70 * taw
     
-    sm_6in = np.full(n_hours, initial_moisture)
-    sm_12in = np.full(n_hours, initial_moisture)
-    sm_18in = np.full(n_hours, initial_moisture)
-    
     # ET depletion rates (inches/hour) - faster near surface
     # Typical peak ET is ~0.3 in/day, distributed by depth
     base_et_rate = 0.012  # in/hour at peak
     
-    # Depth-specific depletion factors (shallow dries faster)
-    depletion_factors = {6: 1.0, 12: 0.6, 18: 0.3}
+    # Depth-specific depletion factors for 6", 12", 18" (shallow dries faster)
+    depletion_factors = np.array([1.0, 0.6, 0.3])
     
     # Generate rain events (if enabled)
-    rain_events = []
+    rain_hours = np.empty(0, dtype=np.int64)
+    rain_amounts = np.empty(0, dtype=np.float64)
     if include_rain_events:
         # Add 2-4 rain events over the period
-        n_events = np.random.randint(2, 5)
-        event_hours = np.random.choice(range(24, n_hours - 24), n_events, replace=False)
-        
-        for hour in event_hours:
-            # Rain amount between 0.2 and 1.0 inches
-            amount = np.random.uniform(0.2, 1.0)
-            rain_events.append((hour, amount))
-    
-    # Simulate moisture dynamics hour by hour
-    for i in range(1, n_hours):
-        hour_of_day = timestamps[i].hour
+        n_events = rng.integers(2, 5)
+        rain_hours = rng.choice(np.arange(24, n_hours - 24), n_events, replace=False)
         
-        # Diurnal ET pattern (peaks at 2pm, minimal at night)
-        if 6 <= hour_of_day <= 20:
-            diurnal_factor = np.sin(np.pi * (hour_of_day - 6) / 14)
-        else:
-            diurnal_factor = 0.0
-        
-        hourly_et = base_et_rate * diurnal_factor
-        
-        # Apply ET depletion at each depth
-        # Convert ET (inches) to volumetric change (approximate)
-        et_volumetric = hourly_et / 6  # Simplified conversion
-        
-        sm_6in[i] = sm_6in[i-1] - et_volumetric * depletion_factors[6]
-        sm_12in[i] = sm_12in[i-1] - et_volumetric * depletion_factors[12]
-        sm_18in[i] = sm_18in[i-1] - et_volumetric * depletion_factors[18]
-        
-        # Check for rain events
-        for event_hour, amount in rain_events:
-            if i == event_hour:
-                # Rain infiltration - immediate at surface, delayed at depth
-                sm_6in[i] += amount * 0.08   # Quick response
-                sm_12in[i] += amount * 0.04  # Delayed
-                sm_18in[i] += amount * 0.02  # More delayed
-            elif event_hour < i < event_hour + 12:
-                # Continued infiltration to deeper depths
-                hours_since = i - event_hour
-                sm_12in[i] += amount * 0.003 * (12 - hours_since) / 12
-                sm_18in[i] += amount * 0.002 * (12 - hours_since) / 12
-        
-        # Clamp values to physically realistic range
-        sm_6in[i] = np.clip(sm_6in[i], pwp * 0.8, fc * 1.05)
-        sm_12in[i] = np.clip(sm_12in[i], pwp * 0.8, fc * 1.05)
-        sm_18in[i] = np.clip(sm_18in[i], pwp * 0.8, fc * 1.05)
+        # Rain amount between 0.2 and 1.0 inches
+        rain_amounts = rng.uniform(0.2, 1.0, n_events)
+    
+    # Diurnal ET pattern (peaks at 2pm, minimal at night)
+    diurnal_factor = np.where(
+        (hours_of_day >= 6) & (hours_of_day <= 20),
+        np.sin(np.pi * (hours_of_day - 6) / 14),
+        0.0
+    )
+    
+    # Convert ET (inches) to volumetric change (approximate)
+    et_volumetric = base_et_rate * diurnal_factor / 6  # Simplified conversion
+    
+    # Rain infiltration per depth, precomputed for every hour
+    rain = _rain_infiltration(n_hours, rain_hours, rain_amounts)
+    
+    # Step moisture forward, clamped to physically realistic range
+    sm_6in, sm_12in, sm_18in = _simulate_moisture(
+        initial_moisture,
+        et_volumetric,
+        depletion_factors,
+        rain,
+        pwp * 0.8,
+        fc * 1.05
+    )
+    
+    # Measurement noise for 3 moisture depths, air and canopy temperature
+    noise = rng.standard_normal((5, n_hours))
     
     # Add measurement noise
-    sm_6in += np.random.normal(0, SENSOR.moisture_noise_std, n_hours)
-    sm_12in += np.random.normal(0, SENSOR.moisture_noise_std, n_hours)
-    sm_18in += np.random.normal(0, SENSOR.moisture_noise_std, n_hours)
+    sm_6in += noise[0] * SENSOR.moisture_noise_std
+    sm_12in += noise[1] * SENSOR.moisture_noise_std
+    sm_18in += noise[2] * SENSOR.moisture_noise_std
     
     # Generate air temperature with diurnal pattern
     # Base temp around 30°C with ±8°C daily swing
     base_temp = 30.0
     daily_amplitude = 8.0
     
-    air_temp = np.array([
-        base_temp + daily_amplitude * np.sin(np.pi * (ts.hour - 6) / 12)
-        if 6 <= ts.hour <= 18 
-        else base_temp - daily_amplitude * 0.5
-        for ts in timestamps
-    ])
-    air_temp += np.random.normal(0, SENSOR.temp_noise_std, n_hours)
+    air_temp = np.where(
+        (hours_of_day >= 6) & (hours_of_day <= 18),
+        base_temp + daily_amplitude * np.sin(np.pi * (hours_of_day - 6) / 12),
+        base_temp - daily_amplitude * 0.5
+    )
+    air_temp += noise[3] * SENSOR.temp_noise_std
     
     # Canopy temperature: typically 1-4°C above air when stressed
     # Healthy, transpiring plants can be cooler than air
     # We'll make it correlate with soil moisture (drier = hotter canopy)
-    avg_moisture = (sm_6in + sm_12in) / 2
-    moisture_stress = 1 - (avg_moisture - pwp) / taw  # 0 = wet, 1 = dry
-    moisture_stress = np.clip(moisture_stress, 0, 1)
+    # Computed in place in a single buffer to avoid temporaries
+    stress = sm_6in + sm_12in
+    stress *= 0.5
+    stress -= pwp
+    stress /= taw
+    np.subtract(1.0, stress, out=stress)  # 0 = wet, 1 = dry
+    np.clip(stress, 0, 1, out=stress)
     
     # Canopy temp offset: -2°C when wet (transpiring) to +5°C when stressed
-    canopy_offset = -2 + 7 * moisture_stress
-    canopy_temp = air_temp + canopy_offset
-    canopy_temp += np.random.normal(0, SENSOR.temp_noise_std * 0.5, n_hours)
-    
-    # Build DataFrame
-    df = pd.DataFrame({
-        'timestamp': timestamps,
-        'sm_6in': np.round(sm_6in, 4),
-        'sm_12in': np.round(sm_12in, 4),
-        'sm_18in': np.round(sm_18in, 4),
-        'canopy_temp_c': np.round(canopy_temp, 1),
-        'air_temp_c': np.round(air_temp, 1),
-    })
+    stress *= 7
+    stress -= 2
+    canopy_temp = air_temp + stress
+    canopy_temp += noise[4] * (SENSOR.temp_noise_std * 0.5)
+    
+    # Pack into float32 blocks (rounding is left to display)
+    moisture = np.stack((sm_6in, sm_12in, sm_18in), dtype=np.float32)
+    temperature = np.stack((canopy_temp, air_temp), dtype=np.float32)
+    
+    # pandas may build the index in a coarser unit (e.g. us); pin it to ns
+    return timestamps.as_unit('ns').asi8, moisture, temperature
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_generate(
+    days: int,
+    soil_texture: str,
+    include_rain_events: bool,
+    seed: int,
+    end_time: pd.Timestamp
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Memoized _generate_columns; arrays are frozen since they are shared."""
+    arrays = _generate_columns(days, soil_texture, include_rain_events, seed, end_time)
+    for values in arrays:
+        values.setflags(write=False)
+    return arrays
+
+
+def generate_sensor_arrays(
+    days: int = 14,
+    soil_texture: str = "Silt Loam",
+    include_rain_events: bool = True,
+    seed: Optional[int] = 42
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generate synthetic soil moisture and canopy temperature data as arrays.
+    
+    The algorithm simulates:
+    1. Base moisture starting at ~70% of field capacity
+    2. Daily ET-driven depletion (faster in shallow depths)
+    3. Rain events that increase moisture (deeper depths respond slower)
+    4. Diurnal canopy temperature patterns
+    
+    Args:
+        days: Number of days of historical data to generate
+        soil_texture: Soil texture class for FC/PWP values
+        include_rain_events: Whether to simulate rain events
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Tuple of:
+        - timestamps: int64 nanoseconds since epoch, shape (n_hours,)
+        - moisture: float32 sm_6in, sm_12in, sm_18in, shape (3, n_hours)
+        - temperature: float32 canopy_temp_c, air_temp_c, shape (2, n_hours)
+    """
+    # Generate hourly timestamps ending at the current hour
+    end_time = pd.Timestamp.now().floor('h')
+    
+    # Seeded runs are deterministic, so reuse them while the hour is unchanged
+    if seed is None:
+        return _generate_columns(days, soil_texture, include_rain_events, seed, end_time)
+    return _cached_generate(days, soil_texture, include_rain_events, seed, end_time)
+
+
+def sensor_frame(
+    timestamps: np.ndarray,
+    moisture: np.ndarray,
+    temperature: np.ndarray
+) -> pd.DataFrame:
+    """
+    Assemble the arrays from generate_sensor_arrays into a DataFrame.
+    
+    Values are concatenated into one float32 array so pandas holds a
+    single contiguous block that never aliases the (possibly cached) inputs.
+    
+    Returns:
+        DataFrame with columns: timestamp, sm_6in, sm_12in, sm_18in, 
+                               canopy_temp_c, air_temp_c
+    """
+    values = np.concatenate((moisture, temperature))
+    df = pd.DataFrame(
+        values.T,
+        columns=['sm_6in', 'sm_12in', 'sm_18in', 'canopy_temp_c', 'air_temp_c']
+    )
+    df.insert(0, 'timestamp', timestamps.view('datetime64[ns]'))
     
     return df
 
 
+def generate_sensor_data(
+    days: int = 14,
+    soil_texture: str = "Silt Loam",
+    include_rain_events: bool = True,
+    seed: Optional[int] = 42
+) -> pd.DataFrame:
+    """
+    Generate synthetic sensor data as a DataFrame.
+    
+    See generate_sensor_arrays for the simulation and arguments.
+    
+    Returns:
+        DataFrame with columns: timestamp, sm_6in, sm_12in, sm_18in, 
+                               canopy_temp_c, air_temp_c
+    """
+    return sensor_frame(*generate_sensor_arrays(
+        days=days,
+        soil_texture=soil_texture,
+        include_rain_events=include_rain_events,
+        seed=seed
+    ))
+
+
 def get_current_conditions(df: pd.DataFrame) -> dict:
     """
     Extract current (most recent) sensor readings.
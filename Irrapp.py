@@ -13,7 +13,7 @@ from datetime import datetime
 
 # Import our modules
 from config import FIELD, SOIL, DISPLAY, get_soil_properties
-from FakeData import generate_sensor_data, get_current_conditions
+from FakeData import generate_sensor_arrays, get_current_conditions, sensor_frame
 from charts import (
     create_soil_moisture_chart,
     create_temperature_chart,
@@ -92,9 +92,9 @@ with st.sidebar:
     
     # Display selected soil properties
     soil_props = get_soil_properties(soil_texture)
-    st.caption(f"Field Capacity: {soil_props['fc']:.2f} cm³/cm³")
-    st.caption(f"Wilting Point: {soil_props['pwp']:.2f} cm³/cm³")
-    st.caption(f"Available Water: {soil_props['taw']:.2f} cm³/cm³")
+    st.caption(f"Field Capacity: {soil_props.fc:.2f} cm³/cm³")
+    st.caption(f"Wilting Point: {soil_props.pwp:.2f} cm³/cm³")
+    st.caption(f"Available Water: {soil_props.taw:.2f} cm³/cm³")
     
     st.markdown("---")
     
@@ -116,14 +116,20 @@ with st.sidebar:
 # =============================================================================
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
+def load_sensor_arrays(days: int, texture: str):
+    """Generate and cache synthetic sensor data as raw arrays."""
+    return generate_sensor_arrays(days=days, soil_texture=texture)
+
+
 def load_sensor_data(days: int, texture: str) -> pd.DataFrame:
-    """Generate and cache synthetic sensor data."""
-    return generate_sensor_data(days=days, soil_texture=texture)
+    """Rebuild the sensor DataFrame from the cached arrays."""
+    return sensor_frame(*load_sensor_arrays(days, texture))
 
 
 # Load data
 df = load_sensor_data(days_history, soil_texture)
 current = get_current_conditions(df)
+prev_24h = df.iloc[-24].to_dict()
 
 
 # =============================================================================
@@ -143,7 +149,7 @@ with col1:
     st.metric(
         label="6\" Soil Moisture",
         value=f"{current['sm_6in']:.3f}",
-        delta=f"{(current['sm_6in'] - df['sm_6in'].iloc[-24]):.3f} (24h)",
+        delta=f"{(current['sm_6in'] - prev_24h['sm_6in']):.3f} (24h)",
         help="Volumetric water content at 6 inch depth"
     )
 
@@ -151,7 +157,7 @@ with col2:
     st.metric(
         label="12\" Soil Moisture",
         value=f"{current['sm_12in']:.3f}",
-        delta=f"{(current['sm_12in'] - df['sm_12in'].iloc[-24]):.3f} (24h)",
+        delta=f"{(current['sm_12in'] - prev_24h['sm_12in']):.3f} (24h)",
         help="Volumetric water content at 12 inch depth"
     )
 
@@ -159,7 +165,7 @@ with col3:
     st.metric(
         label="18\" Soil Moisture",
         value=f"{current['sm_18in']:.3f}",
-        delta=f"{(current['sm_18in'] - df['sm_18in'].iloc[-24]):.3f} (24h)",
+        delta=f"{(current['sm_18in'] - prev_24h['sm_18in']):.3f} (24h)",
         help="Volumetric water content at 18 inch depth"
     )
 
@@ -210,7 +216,14 @@ with st.expander("📋 View Raw Data"):
     st.dataframe(
         df.tail(48).sort_values('timestamp', ascending=False),
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        column_config={
+            'sm_6in': st.column_config.NumberColumn(format="%.4f"),
+            'sm_12in': st.column_config.NumberColumn(format="%.4f"),
+            'sm_18in': st.column_config.NumberColumn(format="%.4f"),
+            'canopy_temp_c': st.column_config.NumberColumn(format="%.1f"),
+            'air_temp_c': st.column_config.NumberColumn(format="%.1f"),
+        }
     )
 
 # Footer
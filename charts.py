@@ -8,16 +8,31 @@ Creates interactive time series visualizations for:
 - Threshold reference lines
 """
 
+import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 from typing import Dict, Optional
 
-import sys
-sys.path.append('..')
 from config import DISPLAY, SOIL, get_soil_properties
 
 
+def _downsample(df: pd.DataFrame, max_points: int = 1500) -> pd.DataFrame:
+    """
+    Thin long histories to at most ~max_points rows before plotting.
+    
+    Uses a fixed stride aligned so the most recent reading is always kept.
+    Short frames are returned unchanged.
+    """
+    n = len(df)
+    if n <= max_points:
+        return df
+    
+    step = -(-n // max_points)  # Ceiling division
+    return df.iloc[(n - 1) % step::step]
+
+
+@st.cache_data(max_entries=32)
 def create_soil_moisture_chart(
     df: pd.DataFrame,
     soil_texture: str = "Silt Loam",
@@ -37,10 +52,10 @@ def create_soil_moisture_chart(
     Returns:
         Plotly Figure object
     """
+    df = _downsample(df)
+    
     # Get soil properties for threshold lines
-    soil_props = get_soil_properties(soil_texture)
-    fc = soil_props["fc"]
-    pwp = soil_props["pwp"]
+    fc, pwp, _ = get_soil_properties(soil_texture)
     
     # Create figure
     fig = go.Figure()
@@ -143,6 +158,8 @@ def create_temperature_chart(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure object
     """
+    df = _downsample(df)
+    
     fig = go.Figure()
     
     # Air temperature trace
@@ -154,25 +171,16 @@ def create_temperature_chart(df: pd.DataFrame) -> go.Figure:
         hovertemplate='%{y:.1f}°C<extra>Air</extra>'
     ))
     
-    # Canopy temperature trace
+    # Canopy temperature trace, shaded down to the air trace to
+    # highlight the Tc - Ta differential
     fig.add_trace(go.Scatter(
         x=df['timestamp'],
         y=df['canopy_temp_c'],
         name='Canopy Temperature',
         line=dict(color='#e74c3c', width=2),
-        hovertemplate='%{y:.1f}°C<extra>Canopy</extra>'
-    ))
-    
-    # Add shaded region between them to highlight differential
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'].tolist() + df['timestamp'].tolist()[::-1],
-        y=df['canopy_temp_c'].tolist() + df['air_temp_c'].tolist()[::-1],
-        fill='toself',
+        fill='tonexty',
         fillcolor='rgba(231, 76, 60, 0.2)',
-        line=dict(color='rgba(255,255,255,0)'),
-        name='Tc - Ta Differential',
-        showlegend=True,
-        hoverinfo='skip'
+        hovertemplate='%{y:.1f}°C<extra>Canopy</extra>'
     ))
     
     fig.update_layout(
@@ -211,10 +219,14 @@ def create_depth_comparison_chart(df: pd.DataFrame) -> go.Figure:
     
     # Get last 72 hours for cleaner visualization
     df_recent = df.tail(72)
+    t = df_recent['timestamp'].to_numpy()
+    s18 = df_recent['sm_18in'].to_numpy()
+    s12 = df_recent['sm_12in'].to_numpy()
+    s6 = df_recent['sm_6in'].to_numpy()
     
     fig.add_trace(go.Scatter(
-        x=df_recent['timestamp'],
-        y=df_recent['sm_18in'],
+        x=t,
+        y=s18,
         name='18" (Deep)',
         fill='tozeroy',
         line=dict(color=DISPLAY.colors['depth_18in']),
@@ -222,8 +234,8 @@ def create_depth_comparison_chart(df: pd.DataFrame) -> go.Figure:
     ))
     
     fig.add_trace(go.Scatter(
-        x=df_recent['timestamp'],
-        y=df_recent['sm_12in'] - df_recent['sm_18in'],
+        x=t,
+        y=s12 - s18,
         name='12" (Middle)',
         fill='tonexty',
         line=dict(color=DISPLAY.colors['depth_12in']),
@@ -231,8 +243,8 @@ def create_depth_comparison_chart(df: pd.DataFrame) -> go.Figure:
     ))
     
     fig.add_trace(go.Scatter(
-        x=df_recent['timestamp'],
-        y=df_recent['sm_6in'] - df_recent['sm_12in'],
+        x=t,
+        y=s6 - s12,
         name='6" (Surface)',
         fill='tonexty',
         line=dict(color=DISPLAY.colors['depth_6in']),
@@ -5,7 +5,7 @@ Centralizes all constants, thresholds, and default settings.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
 
 
 @dataclass
@@ -46,6 +46,13 @@ class SoilConfig:
     default_texture: str = "Silt Loam"
 
 
+class SoilProperties(NamedTuple):
+    """Hydraulic properties of one texture class (cm³/cm³)."""
+    fc: float    # Field capacity
+    pwp: float   # Permanent wilting point
+    taw: float   # Total available water
+
+
 @dataclass
 class WaterBalanceConfig:
     """
@@ -98,16 +105,17 @@ SENSOR = SensorConfig()
 DISPLAY = DisplayConfig()
 
 
-def get_soil_properties(texture: str) -> Dict[str, float]:
+# Precomputed per-texture properties, including TAW
+_TEXTURE_LOOKUP = {
+    texture: SoilProperties(props["fc"], props["pwp"], props["fc"] - props["pwp"])
+    for texture, props in SOIL.TEXTURE_PROPERTIES.items()
+}
+
+
+def get_soil_properties(texture: str) -> SoilProperties:
     """
     Get soil hydraulic properties for a texture class.
     
-    Returns dict with: fc, pwp, taw (total available water)
+    Returns SoilProperties(fc, pwp, taw), falling back to Silt Loam
     """
-    props = SOIL.TEXTURE_PROPERTIES.get(texture, SOIL.TEXTURE_PROPERTIES["Silt Loam"])
-    
-    return {
-        "fc": props["fc"],
-        "pwp": props["pwp"],
-        "taw": props["fc"] - props["pwp"],  # Total Available Water
-    }
\ No newline at end of file
+    return _TEXTURE_LOOKUP.get(texture, _TEXTURE_LOOKUP["Silt Loam"])
\ No newline at end of file